@@ -13,13 +13,14 @@ from textual.widgets import (
     DirectoryTree,
     Footer,
     Header,
+    Input,
     Static,
     TabbedContent,
     TextArea,
 )
 
 from .config import Config
-from .models import EditorPane, EditorState, OpenFile
+from .models import EditorPane, EditorState, MultiSelectState, OpenFile
 from .utils import get_language, path_to_tab_id
 from .widgets import (
     EditorPaneWidget,
@@ -243,6 +244,13 @@ class CliIdeApp(App):
     }
     """
 
+    # Multi-select replacements with at least this many positions rebuild
+    # the document in one pass instead of editing each position
+    MULTISELECT_REBUILD_THRESHOLD = 16
+
+    # Actions that must not steal Enter/Escape from a focused Input
+    INPUT_PASSTHROUGH_ACTIONS = frozenset({"apply_multiselect", "cancel_multiselect"})
+
     BINDINGS = [
         # File operations
         Binding("ctrl+s", "save_file", "Save"),
@@ -286,6 +294,8 @@ class CliIdeApp(App):
         self._terminal: Terminal | None = None
         self._last_search: str = ""
         self._last_search_pos: int = 0
+        # Pane ID -> EditorPaneWidget, filled on first lookup
+        self._pane_widget_cache: dict[str, EditorPaneWidget] = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -329,6 +339,14 @@ class CliIdeApp(App):
         terminal = self.query_one("#terminal-container")
         terminal.styles.height = self.config.terminal.height
 
+    def _get_pane_widget(self, pane_id: str) -> EditorPaneWidget:
+        """Get the widget for a pane, caching it to avoid repeated DOM queries."""
+        pane_widget = self._pane_widget_cache.get(pane_id)
+        if pane_widget is None:
+            pane_widget = self.query_one(f"#pane-{pane_id}", EditorPaneWidget)
+            self._pane_widget_cache[pane_id] = pane_widget
+        return pane_widget
+
     def _update_active_pane_style(self) -> None:
         """Update visual style to show active pane via path bar color."""
         for pane in self.query(EditorPaneWidget):
@@ -408,7 +426,7 @@ class CliIdeApp(App):
         pane.add_file(open_file)
 
         # Open in UI
-        pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+        pane_widget = self._get_pane_widget(pane.id)
 
         async def _open_file_async():
             try:
@@ -459,9 +477,7 @@ class CliIdeApp(App):
 
                     # Update UI
                     try:
-                        pane_widget = self.query_one(
-                            f"#pane-{pane.id}", EditorPaneWidget
-                        )
+                        pane_widget = self._get_pane_widget(pane.id)
                         pane_widget.update_tab_label(
                             open_file.path, open_file.is_modified
                         )
@@ -488,9 +504,7 @@ class CliIdeApp(App):
             pane = self.editor_state.active_pane
             if pane:
                 try:
-                    pane_widget = self.query_one(
-                        f"#pane-{pane.id}", EditorPaneWidget
-                    )
+                    pane_widget = self._get_pane_widget(pane.id)
                     pane_widget.update_tab_label(open_file.path, False)
                     pane_widget._update_path_bar(open_file.path, False)
                 except Exception:
@@ -531,7 +545,7 @@ class CliIdeApp(App):
         next_file = pane.remove_file(open_file.path)
 
         try:
-            pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+            pane_widget = self._get_pane_widget(pane.id)
             await pane_widget.close_tab(tab_id)
 
             # Activate next tab or close split if no tabs left
@@ -560,7 +574,8 @@ class CliIdeApp(App):
         other_pane_id = split_container.get_other_pane_id(pane.id)
 
         if await split_container.close_split(pane.id):
-            self.editor_state.panes.remove(pane)
+            self._pane_widget_cache.pop(pane.id, None)
+            self.editor_state.remove_pane(pane)
             self.editor_state.split_orientation = "none"
             if other_pane_id:
                 self.editor_state.active_pane_id = other_pane_id
@@ -579,9 +594,7 @@ class CliIdeApp(App):
             if open_file:
                 tab_id = path_to_tab_id(open_file.path)
                 try:
-                    pane_widget = self.query_one(
-                        f"#pane-{pane.id}", EditorPaneWidget
-                    )
+                    pane_widget = self._get_pane_widget(pane.id)
                     tabs = pane_widget.query_one(
                         f"#tabs-{pane.id}", TabbedContent
                     )
@@ -602,9 +615,7 @@ class CliIdeApp(App):
             if open_file:
                 tab_id = path_to_tab_id(open_file.path)
                 try:
-                    pane_widget = self.query_one(
-                        f"#pane-{pane.id}", EditorPaneWidget
-                    )
+                    pane_widget = self._get_pane_widget(pane.id)
                     tabs = pane_widget.query_one(
                         f"#tabs-{pane.id}", TabbedContent
                     )
@@ -625,9 +636,7 @@ class CliIdeApp(App):
             if open_file:
                 tab_id = path_to_tab_id(open_file.path)
                 try:
-                    pane_widget = self.query_one(
-                        f"#pane-{pane.id}", EditorPaneWidget
-                    )
+                    pane_widget = self._get_pane_widget(pane.id)
                     tabs = pane_widget.query_one(
                         f"#tabs-{pane.id}", TabbedContent
                     )
@@ -704,7 +713,7 @@ class CliIdeApp(App):
 
             if new_pane_id:
                 new_pane = EditorPane(id=new_pane_id)
-                self.editor_state.panes.append(new_pane)
+                self.editor_state.add_pane(new_pane)
                 self.editor_state.split_orientation = required_orientation
 
         # Get pane IDs after potential split creation
@@ -736,7 +745,7 @@ class CliIdeApp(App):
         # Close tab in current pane
         tab_id = path_to_tab_id(open_file.path)
         try:
-            pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+            pane_widget = self._get_pane_widget(pane.id)
             await pane_widget.close_tab(tab_id)
         except Exception:
             pass
@@ -749,9 +758,7 @@ class CliIdeApp(App):
 
         # Open in target pane UI
         try:
-            target_pane_widget = self.query_one(
-                f"#pane-{target_pane.id}", EditorPaneWidget
-            )
+            target_pane_widget = self._get_pane_widget(target_pane.id)
             await target_pane_widget.open_file(
                 open_file.path, open_file.content, open_file.language
             )
@@ -784,7 +791,7 @@ class CliIdeApp(App):
         pane = self.editor_state.active_pane
         if pane:
             try:
-                pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+                pane_widget = self._get_pane_widget(pane.id)
                 editor = pane_widget.get_active_editor()
                 if editor:
                     editor.focus()
@@ -812,7 +819,7 @@ class CliIdeApp(App):
 
         initial_text = ""
         try:
-            pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+            pane_widget = self._get_pane_widget(pane.id)
             editor = pane_widget.get_active_editor()
             if editor and editor.selected_text:
                 initial_text = editor.selected_text
@@ -834,7 +841,7 @@ class CliIdeApp(App):
         pane = self.editor_state.active_pane
         if pane:
             try:
-                pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+                pane_widget = self._get_pane_widget(pane.id)
                 pane_widget.hide_search_bar()
             except Exception:
                 pass
@@ -848,7 +855,7 @@ class CliIdeApp(App):
             return
 
         try:
-            pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+            pane_widget = self._get_pane_widget(pane.id)
             editor = pane_widget.get_active_editor()
             if not editor:
                 return
@@ -929,7 +936,29 @@ class CliIdeApp(App):
                 except Exception:
                     pass
 
-        self.push_screen(ProjectSearchDialog(self.root_path), handle_result)
+        self.push_screen(
+            ProjectSearchDialog(self.root_path, self._get_open_file_lines),
+            handle_result,
+        )
+
+    def _get_open_file_lines(self, filepath: str) -> list[str] | None:
+        """Get the editor lines of a file open in any pane.
+
+        Search results come from the file on disk, so unsaved buffers are
+        skipped (None) to keep result line numbers valid for the preview.
+        """
+        for pane in self.editor_state.panes:
+            open_file = pane.open_files.get(filepath)
+            if open_file is not None:
+                if open_file.is_modified:
+                    return None
+                try:
+                    editor = self._get_pane_widget(pane.id).get_editor(Path(filepath))
+                except Exception:
+                    continue
+                if editor:
+                    return editor.document.lines
+        return None
 
     def _goto_line(self, line_num: int) -> None:
         """Go to a specific line number in the active editor."""
@@ -938,7 +967,7 @@ class CliIdeApp(App):
             return
 
         try:
-            pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+            pane_widget = self._get_pane_widget(pane.id)
             editor = pane_widget.get_active_editor()
             if editor:
                 # Line numbers are 1-indexed in grep output, 0-indexed in TextArea
@@ -955,7 +984,7 @@ class CliIdeApp(App):
             return
 
         try:
-            pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+            pane_widget = self._get_pane_widget(pane.id)
             editor = pane_widget.get_active_editor()
             if not editor:
                 return
@@ -983,36 +1012,22 @@ class CliIdeApp(App):
                 pane_widget.update_multiselect_status()
 
             # Find next occurrence after the last highlighted position
-            content = editor.text
-
-            # Determine search start position
             if ms.highlighted_positions:
-                last_pos = ms.highlighted_positions[-1]
-                # Convert row, col to string position
-                lines = content.split("\n")
-                search_start = (
-                    sum(len(lines[i]) + 1 for i in range(last_pos[0]))
-                    + last_pos[1]
-                    + len(ms.target_text)
-                )
+                last_row, last_col = ms.highlighted_positions[-1]
+                start = (last_row, last_col + len(ms.target_text))
             else:
-                search_start = 0
+                start = (0, 0)
 
-            # Find next occurrence
-            pos = content.find(ms.target_text, search_start)
-            if pos == -1:
-                # Wrap around to beginning
-                pos = content.find(ms.target_text, 0)
+            if "\n" in ms.target_text:
+                match = self._find_next_in_text(editor, ms.target_text, start)
+            else:
+                match = self._find_next_in_lines(editor, ms.target_text, start)
 
-            if pos != -1:
-                # Convert position to row, col
-                text_before = content[:pos]
-                row = text_before.count("\n")
-                last_newline = text_before.rfind("\n")
-                col = pos - last_newline - 1 if last_newline != -1 else pos
+            if match is not None:
+                row, col = match
 
                 # Check if this position is already highlighted
-                if (row, col) not in ms.highlighted_positions:
+                if not ms.contains(row, col):
                     ms.add_position(row, col)
                     pane_widget.update_multiselect_status()
                     self.notify(f"Selected {ms.count} matches")
@@ -1023,6 +1038,52 @@ class CliIdeApp(App):
         except Exception:
             pass
 
+    def _find_next_in_lines(
+        self, editor: TextArea, target: str, start: tuple[int, int]
+    ) -> tuple[int, int] | None:
+        """Find the next single-line occurrence of target, wrapping around.
+
+        Scans the document line by line, so the row and column of a match are
+        known directly without joining the text or counting newlines.
+        """
+        document = editor.document
+        line_count = document.line_count
+        start_row, start_col = start
+
+        for row in range(start_row, line_count):
+            col = document.get_line(row).find(target, start_col if row == start_row else 0)
+            if col != -1:
+                return (row, col)
+
+        # Wrap around to beginning
+        for row in range(min(start_row + 1, line_count)):
+            col = document.get_line(row).find(target)
+            if col != -1:
+                return (row, col)
+        return None
+
+    def _find_next_in_text(
+        self, editor: TextArea, target: str, start: tuple[int, int]
+    ) -> tuple[int, int] | None:
+        """Find the next occurrence of a multi-line target, wrapping around."""
+        content = editor.text
+        document = editor.document
+        search_start = (
+            sum(len(document.get_line(i)) + 1 for i in range(start[0])) + start[1]
+        )
+
+        pos = content.find(target, search_start)
+        if pos == -1:
+            # Wrap around to beginning
+            pos = content.find(target, 0)
+        if pos == -1:
+            return None
+
+        # Convert position to row, col without copying the prefix
+        row = content.count("\n", 0, pos)
+        col = pos - content.rfind("\n", 0, pos) - 1
+        return (row, col)
+
     def _apply_multiselect_change(
         self, pane_widget: EditorPaneWidget, new_text: str
     ) -> None:
@@ -1037,6 +1098,11 @@ class CliIdeApp(App):
 
         target_len = len(ms.target_text)
 
+        if ms.count >= self.MULTISELECT_REBUILD_THRESHOLD:
+            self._rebuild_multiselect_text(editor, ms, new_text)
+            pane_widget.clear_multiselect()
+            return
+
         # Sort positions in reverse order (bottom-right to top-left) to maintain positions
         sorted_positions = sorted(ms.highlighted_positions, reverse=True)
 
@@ -1057,14 +1123,42 @@ class CliIdeApp(App):
         # Clear multi-select after applying
         pane_widget.clear_multiselect()
 
+    def _rebuild_multiselect_text(
+        self, editor: TextArea, ms: MultiSelectState, new_text: str
+    ) -> None:
+        """Replace every multi-selected occurrence in a single pass.
+
+        The document is rebuilt once and swapped in with one undoable edit,
+        instead of one delete/insert pair per position.
+        """
+        lines = editor.document.lines
+        line_starts = [0] * len(lines)
+        offset = 0
+        for i, line in enumerate(lines):
+            line_starts[i] = offset
+            offset += len(line) + 1
+
+        content = "\n".join(lines)
+        target_len = len(ms.target_text)
+        parts: list[str] = []
+        prev = 0
+        for row, col in sorted(ms.highlighted_positions):
+            # Skip the primary position (already changed by user)
+            if (row, col) == ms.original_selection:
+                continue
+            start = line_starts[row] + col
+            parts.append(content[prev:start])
+            parts.append(new_text)
+            prev = start + target_len
+        parts.append(content[prev:])
+
+        editor.replace("".join(parts), editor.document.start, editor.document.end)
+
     def check_action(self, action: str, parameters: tuple) -> bool | None:
         """Check if action should be enabled."""
-        from textual.widgets import Input
-
         # Don't intercept Enter/Escape if focus is on an Input widget
-        if action in ("apply_multiselect", "cancel_multiselect"):
-            if isinstance(self.focused, Input):
-                return False
+        if action in self.INPUT_PASSTHROUGH_ACTIONS and isinstance(self.focused, Input):
+            return False
         return True
 
     def action_apply_multiselect(self) -> None:
@@ -1074,7 +1168,7 @@ class CliIdeApp(App):
             return
 
         try:
-            pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+            pane_widget = self._get_pane_widget(pane.id)
             ms = pane_widget.multi_select
 
             if not ms.active or ms.count <= 1:
@@ -1090,8 +1184,6 @@ class CliIdeApp(App):
             if not new_text:
                 # Get text at cursor position (user may have typed something)
                 # We need to find what replaced the original selection
-                content = editor.text
-                lines = content.split("\n")
                 cursor = editor.cursor_location
 
                 # The user's cursor should be at the end of what they typed
@@ -1100,7 +1192,7 @@ class CliIdeApp(App):
 
                 if cursor[0] == orig_row:
                     # Same line - extract text between original col and cursor
-                    line = lines[orig_row]
+                    line = editor.document.get_line(orig_row)
                     new_text = line[orig_col : cursor[1]]
                 else:
                     # Different line - just use what's selected or empty
@@ -1121,7 +1213,7 @@ class CliIdeApp(App):
             return
 
         try:
-            pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+            pane_widget = self._get_pane_widget(pane.id)
             ms = pane_widget.multi_select
 
             if ms.active:
@@ -1165,29 +1257,30 @@ class CliIdeApp(App):
             return
 
         try:
-            pane_widget = self.query_one(f"#pane-{pane.id}", EditorPaneWidget)
+            pane_widget = self._get_pane_widget(pane.id)
             editor = pane_widget.get_active_editor()
             if not editor:
                 return
 
-            cursor_loc = editor.cursor_location
-            row = cursor_loc[0]
-            lines = editor.text.split("\n")
+            row = editor.cursor_location[0]
+            # Read line lengths from the document instead of splitting the text
+            document = editor.document
+            line_count = document.line_count
 
-            if row >= len(lines):
+            if row >= line_count:
                 return
 
             # Calculate start and end positions for deletion
             line_start = (row, 0)
-            if row < len(lines) - 1:
+            if row < line_count - 1:
                 # Not the last line: delete up to start of next line
                 line_end = (row + 1, 0)
             else:
                 # Last line: delete to end of line
-                line_end = (row, len(lines[row]))
+                line_end = (row, len(document.get_line(row)))
                 # If not the first line, include the previous newline
                 if row > 0:
-                    line_start = (row - 1, len(lines[row - 1]))
+                    line_start = (row - 1, len(document.get_line(row - 1)))
 
             # Use delete method (this is undoable)
             editor.delete(line_start, line_end)
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 import os
-import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -13,6 +12,8 @@ from ..exceptions import ConfigError
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 @dataclass
 class EditorConfig:
@@ -45,6 +46,14 @@ class SidebarConfig:
     visible: bool = True
 
 
+# Recognized keys per config section and the type each value is coerced to
+_SCHEMA: dict[str, tuple[tuple[str, type], ...]] = {
+    "editor": (("theme", str), ("tab_size", int), ("show_line_numbers", bool)),
+    "terminal": (("shell", str), ("height", int)),
+    "sidebar": (("width", int), ("visible", bool)),
+}
+
+
 @dataclass
 class Config:
     """Main configuration class for CLI-IDE."""
@@ -91,9 +100,10 @@ class Config:
             Invalid configurations are logged but don't raise exceptions.
             The application continues with default values.
         """
+        import tomllib
+
         try:
-            with open(path, "rb") as f:
-                data = tomllib.load(f)
+            data = tomllib.loads(path.read_bytes().decode("utf-8"))
         except FileNotFoundError:
             return  # File doesn't exist, use defaults
         except tomllib.TOMLDecodeError as e:
@@ -103,31 +113,15 @@ class Config:
             logger.warning("Cannot read config file %s: %s", path, e)
             return
 
-        # Editor settings
-        if "editor" in data:
-            editor_data = data["editor"]
-            if "theme" in editor_data:
-                self.editor.theme = str(editor_data["theme"])
-            if "tab_size" in editor_data:
-                self.editor.tab_size = int(editor_data["tab_size"])
-            if "show_line_numbers" in editor_data:
-                self.editor.show_line_numbers = bool(editor_data["show_line_numbers"])
-
-        # Terminal settings
-        if "terminal" in data:
-            terminal_data = data["terminal"]
-            if "shell" in terminal_data:
-                self.terminal.shell = str(terminal_data["shell"])
-            if "height" in terminal_data:
-                self.terminal.height = int(terminal_data["height"])
-
-        # Sidebar settings
-        if "sidebar" in data:
-            sidebar_data = data["sidebar"]
-            if "width" in sidebar_data:
-                self.sidebar.width = int(sidebar_data["width"])
-            if "visible" in sidebar_data:
-                self.sidebar.visible = bool(sidebar_data["visible"])
+        for section, fields in _SCHEMA.items():
+            section_data = data.get(section)
+            if not section_data:
+                continue
+            target = getattr(self, section)
+            for key, cast in fields:
+                value = section_data.get(key, _MISSING)
+                if value is not _MISSING:
+                    setattr(target, key, cast(value))
 
     def save(self) -> None:
         """Save configuration to user config file."""
@@ -148,5 +142,19 @@ height = {self.terminal.height}
 width = {self.sidebar.width}
 visible = {str(self.sidebar.visible).lower()}
 """
-        with open(self.CONFIG_FILE, "w") as f:
-            f.write(content)
+        data = content.encode("utf-8")
+        try:
+            if self.CONFIG_FILE.read_bytes() == data:
+                return  # Nothing changed, skip the write
+        except OSError:
+            pass
+
+        # Write to a temporary file and swap it in so a crash never leaves
+        # a truncated config behind
+        tmp_file = self.CONFIG_FILE.with_suffix(".toml.tmp")
+        try:
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.CONFIG_FILE)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+            raise
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from ..utils import new_pane_id
 
-@dataclass
+
+@dataclass(slots=True)
 class OpenFile:
     """Represents an open file in the editor."""
 
@@ -27,20 +28,37 @@ class OpenFile:
         return f"* {name}" if self.is_modified else name
 
 
-@dataclass
+@dataclass(slots=True)
 class EditorPane:
     """Represents a single editor pane with tabs."""
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=new_pane_id)
     open_files: dict[str, OpenFile] = field(default_factory=dict)
     active_file: Optional[str] = None
     tab_order: list[str] = field(default_factory=list)
+    # Position of each path in tab_order, kept in sync for O(1) lookups
+    _tab_index: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self._tab_index = {path_str: i for i, path_str in enumerate(self.tab_order)}
+
+    def _append_tab(self, path_str: str) -> None:
+        self._tab_index[path_str] = len(self.tab_order)
+        self.tab_order.append(path_str)
+
+    def _remove_tab(self, path_str: str) -> int:
+        """Remove a tab and return the index it occupied."""
+        idx = self._tab_index.pop(path_str)
+        del self.tab_order[idx]
+        for i in range(idx, len(self.tab_order)):
+            self._tab_index[self.tab_order[i]] = i
+        return idx
 
     def add_file(self, open_file: OpenFile) -> None:
         path_str = str(open_file.path)
         if path_str not in self.open_files:
             self.open_files[path_str] = open_file
-            self.tab_order.append(path_str)
+            self._append_tab(path_str)
         self.active_file = path_str
 
     def remove_file(self, path: Path) -> Optional[str]:
@@ -49,9 +67,8 @@ class EditorPane:
         if path_str in self.open_files:
             del self.open_files[path_str]
             try:
-                idx = self.tab_order.index(path_str)
-                self.tab_order.remove(path_str)
-            except ValueError:
+                idx = self._remove_tab(path_str)
+            except KeyError:
                 idx = 0
 
             if self.active_file == path_str:
@@ -65,10 +82,9 @@ class EditorPane:
         """Get next file in tab order."""
         if not self.tab_order or not self.active_file:
             return None
-        try:
-            idx = self.tab_order.index(self.active_file)
-        except ValueError:
-            return self.tab_order[0] if self.tab_order else None
+        idx = self._tab_index.get(self.active_file)
+        if idx is None:
+            return self.tab_order[0]
         next_idx = (idx + 1) % len(self.tab_order)
         return self.tab_order[next_idx]
 
@@ -76,10 +92,9 @@ class EditorPane:
         """Get previous file in tab order."""
         if not self.tab_order or not self.active_file:
             return None
-        try:
-            idx = self.tab_order.index(self.active_file)
-        except ValueError:
-            return self.tab_order[-1] if self.tab_order else None
+        idx = self._tab_index.get(self.active_file)
+        if idx is None:
+            return self.tab_order[-1]
         prev_idx = (idx - 1) % len(self.tab_order)
         return self.tab_order[prev_idx]
 
@@ -90,7 +105,7 @@ class EditorPane:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditorState:
     """Global editor state managing panes and splits."""
 
@@ -99,18 +114,31 @@ class EditorState:
     panes: list[EditorPane] = field(default_factory=list)
     active_pane_id: Optional[str] = None
     split_orientation: str = "none"
+    # Panes keyed by ID, kept in sync with panes via add_pane/remove_pane
+    _by_id: dict[str, EditorPane] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self):
+        self._by_id = {pane.id: pane for pane in self.panes}
         if not self.panes:
             pane = EditorPane(id=self.DEFAULT_PANE_ID)
-            self.panes.append(pane)
+            self.add_pane(pane)
             self.active_pane_id = pane.id
 
+    def add_pane(self, pane: EditorPane) -> None:
+        """Add a pane to the end of the pane list."""
+        self.panes.append(pane)
+        self._by_id[pane.id] = pane
+
+    def remove_pane(self, pane: EditorPane) -> None:
+        """Remove a pane."""
+        self.panes.remove(pane)
+        self._by_id.pop(pane.id, None)
+
     @property
     def active_pane(self) -> Optional[EditorPane]:
-        for pane in self.panes:
-            if pane.id == self.active_pane_id:
-                return pane
+        pane = self._by_id.get(self.active_pane_id)
+        if pane is not None:
+            return pane
         return self.panes[0] if self.panes else None
 
     @property
@@ -121,13 +149,10 @@ class EditorState:
         return None
 
     def get_pane_by_id(self, pane_id: str) -> Optional[EditorPane]:
-        for pane in self.panes:
-            if pane.id == pane_id:
-                return pane
-        return None
+        return self._by_id.get(pane_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiSelectState:
     """State for multi-select mode tracking."""
 
@@ -140,11 +165,17 @@ class MultiSelectState:
     active: bool = False
     # Track the original selection position
     original_selection: tuple[int, int] = (0, 0)
+    # Mirror of highlighted_positions for O(1) membership tests
+    _positions_set: set[tuple[int, int]] = field(default_factory=set, init=False, repr=False)
+
+    def __post_init__(self):
+        self._positions_set = set(self.highlighted_positions)
 
     def reset(self) -> None:
         """Reset multi-select state."""
         self.target_text = ""
         self.highlighted_positions = []
+        self._positions_set = set()
         self.primary_idx = 0
         self.active = False
         self.original_selection = (0, 0)
@@ -152,10 +183,15 @@ class MultiSelectState:
     def add_position(self, row: int, col: int) -> bool:
         """Add a new position to highlight. Returns True if added."""
         pos = (row, col)
-        if pos not in self.highlighted_positions:
-            self.highlighted_positions.append(pos)
-            return True
-        return False
+        if pos in self._positions_set:
+            return False
+        self._positions_set.add(pos)
+        self.highlighted_positions.append(pos)
+        return True
+
+    def contains(self, row: int, col: int) -> bool:
+        """Check whether a position is already highlighted."""
+        return (row, col) in self._positions_set
 
     @property
     def count(self) -> int:
@@ -1,85 +1,102 @@
 """Light theme definitions for CLI-IDE."""
 
+from types import MappingProxyType
+
 from rich.style import Style
 from textual.widgets.text_area import TextAreaTheme
 
-# Custom light theme for syntax highlighting (matching textual-light)
-LIGHT_THEME = TextAreaTheme(
-    name="light-ide",
-    # Based on textual-light app theme colors:
-    # Primary: #004578, Secondary: #0178D4, Accent: #ffa62b
-    # Background: #E0E0E0, Surface: #D8D8D8, Panel: #D0D0D0
-    # Error: #ba3c5b, Success: #4EBF71, Warning: #ffa62b
-    base_style=Style(color="#1a1a1a", bgcolor="#E0E0E0"),
-    gutter_style=Style(color="#666666", bgcolor="#D8D8D8"),
-    cursor_style=Style(color="#ffffff", bgcolor="#004578"),
-    cursor_line_style=Style(bgcolor="#D0D0D0"),
-    cursor_line_gutter_style=Style(color="#1a1a1a", bgcolor="#D0D0D0"),
-    bracket_matching_style=Style(bgcolor="#ffa62b", bold=True),
-    selection_style=Style(bgcolor="#a8c8e8"),
-    syntax_styles={
+# Shared syntax styles (Style is immutable, so one instance serves many scopes)
+_PRIMARY = Style(color="#004578")
+_PRIMARY_BOLD = Style(color="#004578", bold=True)
+_SECONDARY = Style(color="#0178D4")
+_SECONDARY_BOLD = Style(color="#0178D4", bold=True)
+_SUCCESS = Style(color="#4EBF71")
+_ACCENT = Style(color="#b35900")
+_ERROR = Style(color="#ba3c5b")
+_TEXT = Style(color="#1a1a1a")
+_MUTED = Style(color="#666666")
+
+_SYNTAX_STYLES = MappingProxyType(
+    {
         # Text formatting
         "bold": Style(bold=True),
         "italic": Style(italic=True),
         "strikethrough": Style(strike=True),
         # Keywords - Primary color
-        "keyword": Style(color="#004578", bold=True),
-        "keyword.function": Style(color="#004578", bold=True),
-        "keyword.return": Style(color="#004578", bold=True),
-        "keyword.operator": Style(color="#004578"),
-        "conditional": Style(color="#004578", bold=True),
-        "repeat": Style(color="#004578", bold=True),
+        "keyword": _PRIMARY_BOLD,
+        "keyword.function": _PRIMARY_BOLD,
+        "keyword.return": _PRIMARY_BOLD,
+        "keyword.operator": _PRIMARY,
+        "conditional": _PRIMARY_BOLD,
+        "repeat": _PRIMARY_BOLD,
         "exception": Style(color="#ba3c5b", bold=True),
-        "include": Style(color="#004578", bold=True),
+        "include": _PRIMARY_BOLD,
         # Functions and methods - Secondary color
-        "function": Style(color="#0178D4"),
-        "function.call": Style(color="#0178D4"),
-        "method": Style(color="#0178D4"),
-        "method.call": Style(color="#0178D4"),
+        "function": _SECONDARY,
+        "function.call": _SECONDARY,
+        "method": _SECONDARY,
+        "method.call": _SECONDARY,
         # Classes and types
-        "class": Style(color="#0178D4", bold=True),
-        "type": Style(color="#0178D4"),
-        "type.builtin": Style(color="#0178D4"),
-        "type.class": Style(color="#0178D4", bold=True),
+        "class": _SECONDARY_BOLD,
+        "type": _SECONDARY,
+        "type.builtin": _SECONDARY,
+        "type.class": _SECONDARY_BOLD,
         # Strings - Success color (green)
-        "string": Style(color="#4EBF71"),
+        "string": _SUCCESS,
         "string.documentation": Style(color="#4EBF71", italic=True),
-        "inline_code": Style(color="#4EBF71"),
+        "inline_code": _SUCCESS,
         # Numbers and constants - Accent color (orange)
-        "number": Style(color="#b35900"),
-        "float": Style(color="#b35900"),
+        "number": _ACCENT,
+        "float": _ACCENT,
         "boolean": Style(color="#004578", italic=True),
-        "constant.builtin": Style(color="#b35900"),
+        "constant.builtin": _ACCENT,
         # Comments - Muted gray
         "comment": Style(color="#6a737d", italic=True),
         # Operators and punctuation
-        "operator": Style(color="#ba3c5b"),
-        "punctuation.bracket": Style(color="#1a1a1a"),
-        "punctuation.delimiter": Style(color="#1a1a1a"),
-        "punctuation.special": Style(color="#ba3c5b"),
+        "operator": _ERROR,
+        "punctuation.bracket": _TEXT,
+        "punctuation.delimiter": _TEXT,
+        "punctuation.special": _ERROR,
         # Variables and parameters
-        "variable": Style(color="#1a1a1a"),
-        "variable.parameter": Style(color="#b35900"),
-        "parameter": Style(color="#b35900"),
+        "variable": _TEXT,
+        "variable.parameter": _ACCENT,
+        "parameter": _ACCENT,
         # Markdown
-        "heading": Style(color="#004578", bold=True),
-        "heading.marker": Style(color="#666666"),
-        "list.marker": Style(color="#666666"),
-        "link.label": Style(color="#0178D4"),
+        "heading": _PRIMARY_BOLD,
+        "heading.marker": _MUTED,
+        "list.marker": _MUTED,
+        "link.label": _SECONDARY,
         "link.uri": Style(color="#0178D4", underline=True),
         # Tags (HTML/XML) - Secondary color
-        "tag": Style(color="#0178D4"),
+        "tag": _SECONDARY,
         # JSON
-        "json.label": Style(color="#004578", bold=True),
+        "json.label": _PRIMARY_BOLD,
         # YAML
-        "yaml.field": Style(color="#004578", bold=True),
+        "yaml.field": _PRIMARY_BOLD,
         # TOML
-        "toml.type": Style(color="#0178D4"),
+        "toml.type": _SECONDARY,
         # CSS
-        "css.property": Style(color="#004578"),
+        "css.property": _PRIMARY,
         # Custom multi-select highlight
         "multiselect": Style(bgcolor="#ffa62b", color="#000000"),
-    },
+    }
+)
+
+# Custom light theme for syntax highlighting (matching textual-light)
+LIGHT_THEME = TextAreaTheme(
+    name="light-ide",
+    # Based on textual-light app theme colors:
+    # Primary: #004578, Secondary: #0178D4, Accent: #ffa62b
+    # Background: #E0E0E0, Surface: #D8D8D8, Panel: #D0D0D0
+    # Error: #ba3c5b, Success: #4EBF71, Warning: #ffa62b
+    base_style=Style(color="#1a1a1a", bgcolor="#E0E0E0"),
+    gutter_style=Style(color="#666666", bgcolor="#D8D8D8"),
+    cursor_style=Style(color="#ffffff", bgcolor="#004578"),
+    cursor_line_style=Style(bgcolor="#D0D0D0"),
+    cursor_line_gutter_style=Style(color="#1a1a1a", bgcolor="#D0D0D0"),
+    bracket_matching_style=Style(bgcolor="#ffa62b", bold=True),
+    selection_style=Style(bgcolor="#a8c8e8"),
+    syntax_styles=_SYNTAX_STYLES,
 )
 
 # ANSI color mapping for pyte
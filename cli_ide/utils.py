@@ -1,17 +1,42 @@
 """Utility functions for CLI-IDE."""
 
-import hashlib
+import itertools
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from .config.defaults import LANG_MAP
 
+# Matches the longest known suffix at the end of a filename, so compound
+# suffixes like ".module.css" win over their last segment. As with
+# Path.suffix, a leading dot alone (".py") is not a suffix.
+_SUFFIX_RE = re.compile(
+    r"(?<=.)("
+    + "|".join(re.escape(suffix) for suffix in sorted(LANG_MAP, key=len, reverse=True))
+    + r")$",
+    re.IGNORECASE,
+)
 
+# Pane IDs only need to be unique within the process
+_pane_ids = itertools.count()
+
+
+def new_pane_id() -> str:
+    """Generate a short pane ID, unique within this process."""
+    return f"p{next(_pane_ids):x}"
+
+
+@lru_cache(maxsize=512)
 def path_to_tab_id(path: Path) -> str:
     """Convert file path to a valid tab ID."""
+    import hashlib
+
     return f"tab-{hashlib.md5(str(path).encode()).hexdigest()[:8]}"
 
 
+@lru_cache(maxsize=1024)
 def get_language(path: Path) -> Optional[str]:
     """Get language for syntax highlighting."""
-    return LANG_MAP.get(path.suffix.lower())
+    match = _SUFFIX_RE.search(path.name)
+    return LANG_MAP.get(match.group(1).lower()) if match else None
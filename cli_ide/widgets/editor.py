@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import uuid
 from pathlib import Path
 from typing import Optional
 
@@ -10,11 +9,11 @@ from textual import events
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.message import Message
-from textual.widgets import Static, TabbedContent, TabPane, TextArea
+from textual.widgets import Static, Tab, TabbedContent, TabPane, TextArea
 
 from ..models import MultiSelectState
 from ..themes import LIGHT_THEME
-from ..utils import path_to_tab_id
+from ..utils import new_pane_id, path_to_tab_id
 from .search import SearchBar
 
 
@@ -50,22 +49,39 @@ class EditorPaneWidget(Container):
             self.pane_id = pane_id
 
     def __init__(self, pane_id: str | None = None, **kwargs):
-        pane_id = pane_id or str(uuid.uuid4())[:8]
+        pane_id = pane_id or new_pane_id()
         super().__init__(id=f"pane-{pane_id}", **kwargs)
         self.pane_id = pane_id
         self._search_matches: list[tuple[int, int, int]] = []  # (row, col, length)
         self._current_match_idx: int = -1
         self.multi_select = MultiSelectState()
+        # Multi-select highlights already inserted, per row: the editor's
+        # highlight list for that row and the (start, end) spans added to it.
+        # The editor replaces a row's list whenever it rebuilds highlights.
+        self._multiselect_entries: dict[int, tuple[list, set[tuple[int, int]]]] = {}
+        # Child widgets are created once in compose and reused, avoiding a
+        # DOM query on every call
+        self._path_bar = Static("No file open", classes="pane-path-bar")
+        self._tabs = TabbedContent(id=f"tabs-{pane_id}")
+        self._search_bar = SearchBar(id=f"search-bar-{pane_id}")
+        self._multiselect_status = Static(
+            "", id=f"multiselect-status-{pane_id}", classes="multiselect-status"
+        )
+        # Open tab panes by tab ID, in the order they were opened
+        self._open_tabs: dict[str, TabPane] = {}
+        # Tab header widgets and their current labels, by tab ID
+        self._tab_widgets: dict[str, Tab] = {}
+        self._tab_labels: dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
-        yield Static("No file open", classes="pane-path-bar")
-        yield TabbedContent(id=f"tabs-{self.pane_id}")
-        yield SearchBar(id=f"search-bar-{self.pane_id}")
-        yield Static("", id=f"multiselect-status-{self.pane_id}", classes="multiselect-status")
+        yield self._path_bar
+        yield self._tabs
+        yield self._search_bar
+        yield self._multiselect_status
 
     def show_search_bar(self, initial_text: str = "") -> None:
         """Show the inline search bar."""
-        search_bar = self.query_one(f"#search-bar-{self.pane_id}", SearchBar)
+        search_bar = self._search_bar
         search_bar.add_class("visible")
         if initial_text:
             search_bar.set_query(initial_text)
@@ -74,8 +90,7 @@ class EditorPaneWidget(Container):
 
     def hide_search_bar(self) -> None:
         """Hide the inline search bar."""
-        search_bar = self.query_one(f"#search-bar-{self.pane_id}", SearchBar)
-        search_bar.remove_class("visible")
+        self._search_bar.remove_class("visible")
         self._search_matches = []
         self._current_match_idx = -1
         # Focus back to editor
@@ -85,7 +100,7 @@ class EditorPaneWidget(Container):
 
     def update_multiselect_status(self) -> None:
         """Update the multi-select status display and highlights."""
-        status = self.query_one(f"#multiselect-status-{self.pane_id}", Static)
+        status = self._multiselect_status
         if self.multi_select.active and self.multi_select.count > 0:
             status.update(f"Multi-select: {self.multi_select.count} matches")
             status.add_class("visible")
@@ -108,34 +123,44 @@ class EditorPaneWidget(Container):
 
         # Use TextArea's internal _highlights dict
         # Format: _highlights[line_number] = [(start_col, end_col, highlight_name), ...]
+        highlights = editor._highlights
+        entries = self._multiselect_entries
+
+        # Group positions by row so each row's highlights are extended once
+        cols_by_row: dict[int, list[int]] = {}
         for row, col in ms.highlighted_positions:
-            if row not in editor._highlights:
-                editor._highlights[row] = []
-            # Add multiselect highlight
-            highlight_entry = (col, col + target_len, "multiselect")
-            if highlight_entry not in editor._highlights[row]:
-                editor._highlights[row].append(highlight_entry)
+            cols_by_row.setdefault(row, []).append(col)
+
+        for row, cols in cols_by_row.items():
+            row_highlights = highlights.get(row)
+            tracked = entries.get(row)
+            if row_highlights is None:
+                row_highlights = highlights[row] = []
+            if tracked is None or tracked[0] is not row_highlights:
+                # First highlight on this row, or the editor rebuilt its highlights
+                tracked = entries[row] = (row_highlights, set())
+            spans = tracked[1]
+            new_spans = [
+                (col, col + target_len) for col in cols if (col, col + target_len) not in spans
+            ]
+            if new_spans:
+                spans.update(new_spans)
+                row_highlights.extend((start, end, "multiselect") for start, end in new_spans)
 
         editor.refresh()
 
     def _clear_multiselect_highlights(self) -> None:
         """Clear multi-select highlights from editor."""
-        editor = self.get_active_editor()
-        if not editor:
-            return
+        # Only rows that received multiselect highlights need filtering. The
+        # tracked lists are filtered in place, so this also covers an editor
+        # that is no longer the active one.
+        for row_highlights, _ in self._multiselect_entries.values():
+            row_highlights[:] = [h for h in row_highlights if h[2] != "multiselect"]
+        self._multiselect_entries.clear()
 
-        # Remove multiselect highlights from all lines
-        for line_num in list(editor._highlights.keys()):
-            editor._highlights[line_num] = [
-                h
-                for h in editor._highlights[line_num]
-                if len(h) < 3 or h[2] != "multiselect"
-            ]
-            # Clean up empty entries
-            if not editor._highlights[line_num]:
-                del editor._highlights[line_num]
-
-        editor.refresh()
+        editor = self.get_active_editor()
+        if editor:
+            editor.refresh()
 
     def clear_multiselect(self) -> None:
         """Clear multi-select mode."""
@@ -153,16 +178,14 @@ class EditorPaneWidget(Container):
         self, path: Path, content: str, language: Optional[str] = None
     ) -> None:
         """Open a file in a new tab or switch to existing tab."""
-        tabs = self.query_one(f"#tabs-{self.pane_id}", TabbedContent)
+        tabs = self._tabs
         tab_id = path_to_tab_id(path)
 
         # Check if already open
-        existing_tabs = tabs.query(TabPane)
-        for tab in existing_tabs:
-            if tab.id == tab_id:
-                tabs.active = tab_id
-                self._update_path_bar(path)
-                return
+        if tab_id in self._open_tabs:
+            tabs.active = tab_id
+            self._update_path_bar(path)
+            return
 
         # Create new tab with editor
         editor = TextArea(
@@ -184,52 +207,48 @@ class EditorPaneWidget(Container):
 
         pane = TabPane(path.name, editor, id=tab_id)
         await tabs.add_pane(pane)
+        self._open_tabs[tab_id] = pane
+        self._tab_widgets[tab_id] = tabs.get_tab(tab_id)
+        self._tab_labels[tab_id] = path.name
         tabs.active = tab_id
         self._update_path_bar(path)
 
     def _update_path_bar(self, path: Path, modified: bool = False) -> None:
-        path_bar = self.query_one(".pane-path-bar", Static)
         display = f"* {path}" if modified else str(path)
-        path_bar.update(display)
+        self._path_bar.update(display)
 
     def update_tab_label(self, path: Path, modified: bool) -> None:
         """Update tab label to show modified state."""
-        tabs = self.query_one(f"#tabs-{self.pane_id}", TabbedContent)
         tab_id = path_to_tab_id(path)
         name = path.name
         display = f"* {name}" if modified else name
 
-        # Find and update the tab
-        try:
-            # TabbedContent uses ContentTabs internally
-            content_tabs = tabs.query_one("ContentTabs")
-            for tab in content_tabs.query("Tab"):
-                if tab.id and tab.id.endswith(tab_id):
-                    tab.label = display
-                    break
-        except Exception:
-            pass
+        # Skip the update while typing if the label is already correct
+        tab = self._tab_widgets.get(tab_id)
+        if tab is None or self._tab_labels.get(tab_id) == display:
+            return
+        tab.label = display
+        self._tab_labels[tab_id] = display
 
     async def close_tab(self, tab_id: str) -> None:
         """Close a tab by ID."""
-        tabs = self.query_one(f"#tabs-{self.pane_id}", TabbedContent)
-        await tabs.remove_pane(tab_id)
+        await self._tabs.remove_pane(tab_id)
+        self._open_tabs.pop(tab_id, None)
+        self._tab_widgets.pop(tab_id, None)
+        self._tab_labels.pop(tab_id, None)
 
         # Update path bar
-        remaining = list(tabs.query(TabPane))
-        if not remaining:
-            path_bar = self.query_one(".pane-path-bar", Static)
-            path_bar.update("No file open")
+        if not self._open_tabs:
+            self._path_bar.update("No file open")
 
     def get_active_tab_id(self) -> Optional[str]:
         """Get currently active tab ID."""
-        tabs = self.query_one(f"#tabs-{self.pane_id}", TabbedContent)
+        tabs = self._tabs
         return tabs.active if tabs.active else None
 
     def get_active_editor(self) -> Optional[TextArea]:
         """Get currently active editor."""
-        tabs = self.query_one(f"#tabs-{self.pane_id}", TabbedContent)
-        active_pane = tabs.active_pane
+        active_pane = self._tabs.active_pane
         if active_pane:
             try:
                 return active_pane.query_one(TextArea)
@@ -237,10 +256,19 @@ class EditorPaneWidget(Container):
                 return None
         return None
 
+    def get_editor(self, path: Path) -> Optional[TextArea]:
+        """Get the editor for a file open in this pane."""
+        tab = self._open_tabs.get(path_to_tab_id(path))
+        if tab is None:
+            return None
+        try:
+            return tab.query_one(TextArea)
+        except Exception:
+            return None
+
     def get_tab_count(self) -> int:
         """Get number of open tabs."""
-        tabs = self.query_one(f"#tabs-{self.pane_id}", TabbedContent)
-        return len(list(tabs.query(TabPane)))
+        return len(self._open_tabs)
 
 
 class SplitContainer(Container):
@@ -251,9 +279,13 @@ class SplitContainer(Container):
     def __init__(self, **kwargs):
         super().__init__(id="split-container", **kwargs)
         self.orientation: str = "none"
+        # Pane widgets by pane ID, in layout order (left/top first)
+        self._panes: dict[str, EditorPaneWidget] = {}
 
     def compose(self) -> ComposeResult:
-        yield EditorPaneWidget(pane_id=self.DEFAULT_PANE_ID)
+        pane = EditorPaneWidget(pane_id=self.DEFAULT_PANE_ID)
+        self._panes[pane.pane_id] = pane
+        yield pane
 
     async def split_horizontal(self) -> Optional[str]:
         """Split horizontally (left/right). Returns new pane ID."""
@@ -262,14 +294,15 @@ class SplitContainer(Container):
 
         self.orientation = "horizontal"
         # Mark first pane as left
-        first_pane = self.query_one(EditorPaneWidget)
+        first_pane = next(iter(self._panes.values()))
         first_pane.add_class("left-pane")
 
-        new_pane_id = str(uuid.uuid4())[:8]
-        new_pane = EditorPaneWidget(pane_id=new_pane_id)
+        pane_id = new_pane_id()
+        new_pane = EditorPaneWidget(pane_id=pane_id)
         await self.mount(new_pane)
+        self._panes[pane_id] = new_pane
         self.add_class("horizontal")
-        return new_pane_id
+        return pane_id
 
     async def split_vertical(self) -> Optional[str]:
         """Split vertically (top/bottom). Returns new pane ID."""
@@ -278,29 +311,33 @@ class SplitContainer(Container):
 
         self.orientation = "vertical"
         # Mark first pane as top
-        first_pane = self.query_one(EditorPaneWidget)
+        first_pane = next(iter(self._panes.values()))
         first_pane.add_class("top-pane")
 
-        new_pane_id = str(uuid.uuid4())[:8]
-        new_pane = EditorPaneWidget(pane_id=new_pane_id)
+        pane_id = new_pane_id()
+        new_pane = EditorPaneWidget(pane_id=pane_id)
         await self.mount(new_pane)
+        self._panes[pane_id] = new_pane
         self.add_class("vertical")
-        return new_pane_id
+        return pane_id
 
     async def close_split(self, pane_id: str) -> bool:
         """Close a split pane. Returns True if closed."""
-        panes = list(self.query(EditorPaneWidget))
-        if len(panes) <= 1:
+        if len(self._panes) <= 1:
+            return False
+
+        pane = self._panes.get(pane_id)
+        if pane is None:
             return False
 
         try:
-            pane = self.query_one(f"#pane-{pane_id}", EditorPaneWidget)
             await pane.remove()
+            del self._panes[pane_id]
             self.orientation = "none"
             self.remove_class("horizontal")
             self.remove_class("vertical")
             # Remove position classes from remaining pane
-            remaining = self.query_one(EditorPaneWidget)
+            remaining = next(iter(self._panes.values()))
             remaining.remove_class("left-pane")
             remaining.remove_class("top-pane")
             return True
@@ -309,12 +346,11 @@ class SplitContainer(Container):
 
     def get_pane_ids(self) -> list[str]:
         """Get all pane IDs."""
-        return [pane.pane_id for pane in self.query(EditorPaneWidget)]
+        return list(self._panes)
 
     def get_other_pane_id(self, current_id: str) -> Optional[str]:
         """Get the other pane ID in a split."""
-        pane_ids = self.get_pane_ids()
-        for pid in pane_ids:
+        for pid in self._panes:
             if pid != current_id:
                 return pid
         return None
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import subprocess
+import itertools
+import os
+from collections import OrderedDict
 from pathlib import Path
+from typing import Callable, Optional
 
 from rich.text import Text
 from textual import events, on
@@ -13,8 +16,21 @@ from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.message import Message
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button, Input, Label, Static
 
+# orjson parses ripgrep's JSON output faster when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Preview lines read from disk, keyed by (filepath, mtime_ns, line_num) so an
+# edited file misses the cache. Shared across dialogs, least recently used
+# entries are evicted first.
+_PREVIEW_CACHE_SIZE = 256
+_preview_cache: OrderedDict[tuple[str, int, int], list[str]] = OrderedDict()
+
 
 class SearchInput(Input):
     """Custom Input that notifies parent on Enter key."""
@@ -40,6 +56,9 @@ class SearchBar(Container):
 
     can_focus = True
 
+    # Seconds to wait after the last keystroke before searching as you type
+    SEARCH_DEBOUNCE = 0.08
+
     class SearchSubmitted(Message):
         """Message when search is submitted."""
 
@@ -53,6 +72,11 @@ class SearchBar(Container):
 
         pass
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._debounce_timer: Optional[Timer] = None
+        self._pending_query = ""
+
     def compose(self) -> ComposeResult:
         with Horizontal(id="search-bar-content"):
             yield SearchInput(id="search-input", placeholder="Find...")
@@ -65,10 +89,22 @@ class SearchBar(Container):
         """Focus the search input."""
         self.query_one("#search-input", SearchInput).focus()
 
+    def _cancel_debounce(self) -> None:
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+            self._debounce_timer = None
+
+    def _flush_debounce(self) -> None:
+        """Run a pending search-as-you-type now instead of after the delay."""
+        if self._debounce_timer is not None:
+            self._submit_first()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "close-search":
+            self._cancel_debounce()
             self.post_message(self.SearchClosed())
         elif event.button.id in ("find-next", "find-prev"):
+            self._flush_debounce()
             query = self.query_one("#search-input", SearchInput).value
             if query:
                 direction = "next" if event.button.id == "find-next" else "prev"
@@ -76,18 +112,26 @@ class SearchBar(Container):
 
     def on_search_input_enter_pressed(self, event: SearchInput.EnterPressed) -> None:
         """Handle Enter key in search input - find next match."""
+        self._flush_debounce()
         if event.value:
             self.post_message(self.SearchSubmitted(event.value, "next"))
 
     @on(Input.Changed, "#search-input")
     def _on_search_changed(self, event: Input.Changed) -> None:
-        """Handle text change - find first match."""
+        """Handle text change - find first match once typing pauses."""
+        self._cancel_debounce()
         query = event.value
         if query:
-            self.post_message(self.SearchSubmitted(query, "first"))
+            self._pending_query = query
+            self._debounce_timer = self.set_timer(self.SEARCH_DEBOUNCE, self._submit_first)
+
+    def _submit_first(self) -> None:
+        self._cancel_debounce()
+        self.post_message(self.SearchSubmitted(self._pending_query, "first"))
 
     def on_key(self, event: events.Key) -> None:
         if event.key == "escape":
+            self._cancel_debounce()
             self.post_message(self.SearchClosed())
             event.stop()
 
@@ -120,6 +164,7 @@ class SearchResultItem(Static):
         rel_path: str,
         root_path: Path,
         result_idx: int,
+        content_provider: Optional[Callable[[str], Optional[list[str]]]] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -129,21 +174,37 @@ class SearchResultItem(Static):
         self.rel_path = rel_path
         self.root_path = root_path
         self.result_idx = result_idx
+        self.content_provider = content_provider
         self.expanded = False
         self._preview_lines: list[str] = []
-
-    def render(self) -> Text:
+        self._preview_start: int = 1
+        # Rendered text for each state, built on first render
+        self._collapsed_text: Optional[Text] = None
+        self._expanded_text: Optional[Text] = None
+        # Height last set by toggle_expand; None while CSS sizes the item
+        self._height: Optional[int] = None
+
+    def _render_header(self, icon: str) -> Text:
         text = Text()
-        icon = "▼ " if self.expanded else "▶ "
         text.append(icon, style="bold")
         text.append(self.rel_path, style="cyan")
         text.append(f":{self.line_num}", style="yellow")
-        text.append(f" {self.content.strip()[:40]}")
+        text.append(f" {self.content[:200].strip()[:40]}")
+        return text
 
-        if self.expanded and self._preview_lines:
+    def render(self) -> Text:
+        if not self.expanded:
+            if self._collapsed_text is None:
+                self._collapsed_text = self._render_header("▶ ")
+            return self._collapsed_text
+        if self._expanded_text is not None:
+            return self._expanded_text
+
+        text = self._render_header("▼ ")
+        if self._preview_lines:
             text.append("\n")
             for i, line in enumerate(self._preview_lines):
-                line_no = self.line_num - 5 + i
+                line_no = self._preview_start + i
                 if line_no == self.line_num:
                     text.append(f"  → {line_no:4d} │ ", style="bold yellow")
                     text.append(f"{line}\n", style="bold")
@@ -151,6 +212,7 @@ class SearchResultItem(Static):
                     text.append(f"    {line_no:4d} │ ", style="dim")
                     text.append(f"{line}\n")
 
+        self._expanded_text = text
         return text
 
     def toggle_expand(self) -> None:
@@ -158,25 +220,42 @@ class SearchResultItem(Static):
         self.expanded = not self.expanded
         if self.expanded and not self._preview_lines:
             self._load_preview()
-        if self.expanded:
-            self.styles.height = len(self._preview_lines) + 1
+            self._expanded_text = None
+        height = len(self._preview_lines) + 1 if self.expanded else 1
+        if self._height != height:
+            # A height change already triggers a layout refresh
+            self._height = height
+            self.styles.height = height
         else:
-            self.styles.height = 1
-        self.refresh()
+            self.refresh()
 
     def _load_preview(self) -> None:
         """Load 5 lines before and after the match."""
+        start = max(0, self.line_num - 6)
+        end = self.line_num + 5
+        self._preview_start = start + 1
         try:
+            # Prefer the buffer of a file already open in an editor
+            lines = self.content_provider(self.filepath) if self.content_provider else None
+            if lines is not None:
+                self._preview_lines = [line.rstrip()[:70] for line in lines[start:end]]
+                return
+
+            key = (self.filepath, os.stat(self.filepath).st_mtime_ns, self.line_num)
+            cached = _preview_cache.get(key)
+            if cached is not None:
+                _preview_cache.move_to_end(key)
+                self._preview_lines = cached
+                return
+
+            # Read only the preview window from disk
             with open(self.filepath, "r", encoding="utf-8") as f:
-                all_lines = f.readlines()
-
-            start = max(0, self.line_num - 6)
-            end = min(len(all_lines), self.line_num + 5)
+                preview = list(itertools.islice(f, start, end))
 
-            self._preview_lines = []
-            for i in range(start, end):
-                line = all_lines[i].rstrip()[:70]
-                self._preview_lines.append(line)
+            self._preview_lines = [line.rstrip()[:70] for line in preview]
+            _preview_cache[key] = self._preview_lines
+            if len(_preview_cache) > _PREVIEW_CACHE_SIZE:
+                _preview_cache.popitem(last=False)
         except Exception:
             self._preview_lines = ["  (Unable to load preview)"]
 
@@ -268,12 +347,63 @@ class ProjectSearchDialog(ModalScreen[str]):
     }
     """
 
-    def __init__(self, root_path: Path):
+    # Stream reader limit; longer lines are skipped instead of being
+    # buffered without bound
+    MAX_OUTPUT_LINE_BYTES = 1024 * 1024
+
+    # Result widgets are mounted this many at a time as the list is scrolled
+    RESULT_PAGE_SIZE = 20
+
+    # Matched line text is clipped to this many characters
+    MAX_RESULT_COLUMNS = 200
+
+    # Search command lines; the search text and root path are appended.
+    # ripgrep applies .gitignore and skips hidden paths on its own, and
+    # search.ignore covers projects without ignore files of their own.
+    RG_ARGV = (
+        "rg",
+        "--json",
+        "-m",
+        "50",
+        "--ignore-file",
+        str(Path(__file__).with_name("search.ignore")),
+        "--max-depth",
+        "10",
+    )
+    GREP_ARGV = (
+        "grep",
+        "-rn",
+        "-m",
+        "50",
+        "--include=*.py",
+        "--include=*.js",
+        "--include=*.ts",
+        "--include=*.tsx",
+        "--include=*.json",
+        "--include=*.md",
+        "--exclude-dir=node_modules",
+        "--exclude-dir=.git",
+        "--exclude-dir=__pycache__",
+        "--exclude-dir=.venv",
+    )
+
+    def __init__(
+        self,
+        root_path: Path,
+        content_provider: Optional[Callable[[str], Optional[list[str]]]] = None,
+    ):
         super().__init__()
         self.root_path = root_path
+        # Returns the lines of a file already open in an editor, or None
+        self.content_provider = content_provider
         self.results: list[tuple[str, int, str]] = []
         self._use_rg = self._check_ripgrep()
         self._selected_idx: int = -1
+        # Result widgets not mounted yet, in result order
+        self._pending_items: list[SearchResultItem] = []
+        # Bumped for every new search; older searches and page mounts check
+        # it before touching the results
+        self._search_generation = 0
 
     def _check_ripgrep(self) -> bool:
         """Check if ripgrep is available."""
@@ -296,11 +426,52 @@ class ProjectSearchDialog(ModalScreen[str]):
                 yield Button("Close", id="close-project-search")
 
     def on_mount(self) -> None:
-        self.query_one("#project-search-input", SearchInput).focus()
+        self._search_input = self.query_one("#project-search-input", SearchInput)
+        self._result_count = self.query_one("#result-count", Static)
+        self._results_container = self.query_one("#project-search-results", VerticalScroll)
+        self._search_input.focus()
+        self.watch(
+            self._results_container,
+            "scroll_y",
+            self._on_results_scrolled,
+            init=False,
+        )
+
+    def _on_results_scrolled(self, scroll_y: float) -> None:
+        """Mount the next page of results when scrolled near the end."""
+        if not self._pending_items:
+            return
+        results_container = self._results_container
+        if scroll_y >= results_container.max_scroll_y - results_container.size.height:
+            # Same group as the search, so a new search cancels it
+            self.run_worker(
+                self._mount_next_page(self._search_generation), group="search"
+            )
+
+    async def _mount_next_page(self, generation: int) -> None:
+        """Mount one page of pending results, then top up if the list can't scroll yet."""
+        if generation != self._search_generation:
+            return
+        page = self._pending_items[: self.RESULT_PAGE_SIZE]
+        del self._pending_items[: self.RESULT_PAGE_SIZE]
+        await self._results_container.mount_all(page)
+        if generation != self._search_generation:
+            return
+        # scroll_y won't change while everything fits, so re-check after layout
+        self.call_after_refresh(
+            lambda: self._on_results_scrolled(self._results_container.scroll_y)
+        )
+
+    def _start_search(self) -> None:
+        """Start a search, cancelling any search or page mount still running."""
+        self._search_generation += 1
+        self.run_worker(
+            self._do_search(self._search_generation), group="search", exclusive=True
+        )
 
     def on_search_input_enter_pressed(self, event: SearchInput.EnterPressed) -> None:
         """Handle Enter key in search input."""
-        asyncio.create_task(self._do_search())
+        self._start_search()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "close-project-search":
@@ -308,7 +479,7 @@ class ProjectSearchDialog(ModalScreen[str]):
         elif event.button.id == "open-file-btn":
             self._open_selected_file()
         elif event.button.id == "search-btn":
-            asyncio.create_task(self._do_search())
+            self._start_search()
 
     def on_search_result_item_selected(self, event: SearchResultItem.Selected) -> None:
         """Handle double-click or Enter on search result."""
@@ -318,7 +489,7 @@ class ProjectSearchDialog(ModalScreen[str]):
         """Action for Enter key - search or open file."""
         focused = self.app.focused
         if isinstance(focused, Input):
-            asyncio.create_task(self._do_search())
+            self._start_search()
         elif isinstance(focused, SearchResultItem):
             focused.post_message(
                 SearchResultItem.Selected(focused.filepath, focused.line_num)
@@ -332,8 +503,7 @@ class ProjectSearchDialog(ModalScreen[str]):
 
     def _update_selection(self) -> None:
         """Update visual selection state."""
-        results_container = self.query_one("#project-search-results")
-        for item in results_container.query(SearchResultItem):
+        for item in self._results_container.query(SearchResultItem):
             if item.result_idx == self._selected_idx:
                 item.add_class("-selected")
             else:
@@ -345,110 +515,171 @@ class ProjectSearchDialog(ModalScreen[str]):
             filepath, line_num, _ = self.results[self._selected_idx]
             self.dismiss(f"{filepath}:{line_num}")
 
-    async def _do_search(self) -> None:
-        search_text = self.query_one("#project-search-input", SearchInput).value
+    @staticmethod
+    def _parse_rg_line(raw_line: bytes) -> Optional[tuple[str, int, str]]:
+        """Parse one ``rg --json`` event into (filepath, line_num, content)."""
+        try:
+            event = _json_loads(raw_line)
+        except ValueError:
+            return None
+        if event.get("type") != "match":
+            return None
+        data = event["data"]
+        # Paths and lines that are not valid UTF-8 are reported base64
+        # encoded under "bytes"; those cannot be opened in the editor anyway
+        filepath = data["path"].get("text")
+        content = data["lines"].get("text")
+        line_num = data.get("line_number")
+        if filepath is None or content is None or line_num is None:
+            return None
+        return filepath, line_num, content.rstrip("\n")
+
+    @staticmethod
+    def _parse_grep_line(raw_line: bytes) -> Optional[tuple[str, int, str]]:
+        """Parse one ``path:line:content`` grep line."""
+        line = raw_line.decode("utf-8", errors="replace").rstrip("\n")
+        filepath, _, rest = line.partition(":")
+        line_num_str, sep, content = rest.partition(":")
+        if not sep or not line_num_str.isdigit():
+            return None
+        return filepath, int(line_num_str), content
+
+    @staticmethod
+    async def _read_output_line(stdout: asyncio.StreamReader) -> Optional[bytes]:
+        """Read one line of search output.
+
+        Returns b"" at end of output, and None for a line longer than the
+        stream limit, which is discarded so the search can continue.
+        """
+        try:
+            return await stdout.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            # Last line without a newline, or b"" at end of output
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+        # Drop the oversized line up to and including its newline
+        while True:
+            await stdout.readexactly(consumed)
+            try:
+                await stdout.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as e:
+                consumed = e.consumed
+
+    async def _do_search(self, generation: int) -> None:
+        result_count = self._result_count
+        search_text = self._search_input.value
         if not search_text or len(search_text) < 2:
-            self.query_one("#result-count", Static).update(
-                "Enter at least 2 characters"
-            )
+            result_count.update("Enter at least 2 characters")
             return
 
-        results_container = self.query_one("#project-search-results", VerticalScroll)
+        results_container = self._results_container
         await results_container.remove_children()
+        if generation != self._search_generation:
+            return
         self.results = []
         self._selected_idx = -1
+        self._pending_items = []
 
-        self.query_one("#result-count", Static).update("Searching...")
+        result_count.update("Searching...")
         self.refresh()
 
+        if self._use_rg:
+            argv = self.RG_ARGV + (search_text, str(self.root_path))
+            parse_line = self._parse_rg_line
+            timeout = 5
+        else:
+            argv = self.GREP_ARGV + (search_text, str(self.root_path))
+            parse_line = self._parse_grep_line
+            timeout = 10
+
         try:
-            if self._use_rg:
-                result = subprocess.run(
-                    [
-                        "rg",
-                        "--line-number",
-                        "--no-heading",
-                        "--color=never",
-                        "-m",
-                        "50",
-                        "-g",
-                        "!node_modules",
-                        "-g",
-                        "!.git",
-                        "-g",
-                        "!__pycache__",
-                        "-g",
-                        "!*.min.*",
-                        "-g",
-                        "!.venv",
-                        "--max-depth",
-                        "10",
-                        search_text,
-                        str(self.root_path),
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-            else:
-                result = subprocess.run(
-                    [
-                        "grep",
-                        "-rn",
-                        "-m",
-                        "50",
-                        "--include=*.py",
-                        "--include=*.js",
-                        "--include=*.ts",
-                        "--include=*.tsx",
-                        "--include=*.json",
-                        "--include=*.md",
-                        "--exclude-dir=node_modules",
-                        "--exclude-dir=.git",
-                        "--exclude-dir=__pycache__",
-                        "--exclude-dir=.venv",
-                        search_text,
-                        str(self.root_path),
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=self.MAX_OUTPUT_LINE_BYTES,
+            )
+        except Exception as e:
+            if generation == self._search_generation:
+                result_count.update(f"Error: {str(e)[:30]}")
+            return
 
-            output = result.stdout.strip()
-            if output:
-                lines = output.split("\n")[:50]
-                for idx, line in enumerate(lines):
-                    parts = line.split(":", 2)
-                    if len(parts) >= 3:
-                        filepath, line_num, content = parts[0], parts[1], parts[2]
-                        try:
-                            rel_path = str(Path(filepath).relative_to(self.root_path))
-                        except ValueError:
+        # Read matches as the search produces them instead of waiting for it
+        # to finish, and mount all result widgets in a single batch
+        # Collected locally so a superseded search never touches self.results
+        results: list[tuple[str, int, str]] = []
+        items: list[SearchResultItem] = []
+        root_prefix = os.path.join(str(self.root_path), "")
+        try:
+            async with asyncio.timeout(timeout):
+                while len(results) < 50:
+                    raw_line = await self._read_output_line(proc.stdout)
+                    if raw_line is None:
+                        continue
+                    if not raw_line:
+                        break
+                    match = parse_line(raw_line)
+                    if match is not None:
+                        filepath, line_num, content = match
+                        # rg ignores --max-columns with --json and grep has no
+                        # equivalent; lines over the stream limit are already
+                        # skipped, so clip what is left here
+                        content = content[: self.MAX_RESULT_COLUMNS]
+                        # Output paths start with the root path we passed in
+                        if filepath.startswith(root_prefix):
+                            rel_path = filepath[len(root_prefix) :]
+                        else:
                             rel_path = filepath
 
                         if len(rel_path) > 40:
                             rel_path = "..." + rel_path[-37:]
 
-                        self.results.append((filepath, int(line_num), content))
-
-                        item = SearchResultItem(
-                            filepath=filepath,
-                            line_num=int(line_num),
-                            content=content,
-                            rel_path=rel_path,
-                            root_path=self.root_path,
-                            result_idx=len(self.results) - 1,
-                            id=f"result-{len(self.results)-1}",
+                        results.append((filepath, line_num, content))
+
+                        items.append(
+                            SearchResultItem(
+                                filepath=filepath,
+                                line_num=line_num,
+                                content=content,
+                                rel_path=rel_path,
+                                root_path=self.root_path,
+                                result_idx=len(results) - 1,
+                                content_provider=self.content_provider,
+                                id=f"result-{len(results)-1}",
+                            )
                         )
-                        await results_container.mount(item)
 
-                self.query_one("#result-count", Static).update(
-                    f"{len(self.results)} matches (click to preview)"
-                )
-            else:
-                self.query_one("#result-count", Static).update("No matches found")
-        except subprocess.TimeoutExpired:
-            self.query_one("#result-count", Static).update("Search timed out")
+                        if len(results) % 10 == 0:
+                            if generation == self._search_generation:
+                                result_count.update(f"Found {len(results)} so far...")
+                            # Let the UI process input between batches
+                            await asyncio.sleep(0)
+        except TimeoutError:
+            if generation == self._search_generation:
+                result_count.update("Search timed out")
+            return
         except Exception as e:
-            self.query_one("#result-count", Static).update(f"Error: {str(e)[:30]}")
+            if generation == self._search_generation:
+                result_count.update(f"Error: {str(e)[:30]}")
+            return
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+        if generation != self._search_generation:
+            return
+        self.results = results
+        if items:
+            # Only the first page is laid out now; the rest mount on scroll
+            self._pending_items = items
+            await self._mount_next_page(generation)
+            if generation == self._search_generation:
+                result_count.update(f"{len(results)} matches (click to preview)")
+        else:
+            result_count.update("No matches found")
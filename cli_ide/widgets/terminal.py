@@ -6,8 +6,10 @@ import asyncio
 import fcntl
 import os
 import pty
+import signal
 import struct
 import termios
+import time
 from pathlib import Path
 
 from rich.text import Text
@@ -22,6 +24,41 @@ try:
 except ImportError:
     pyte = None
 
+_MISSING = object()
+
+_NEWLINE = Text("\n")
+
+# Palettes merged for a single lookup per color; the normal palette wins
+# where a name appears in both
+_FG_COLORS = {**PYTE_BRIGHT_COLORS, **PYTE_COLORS}
+_BG_COLORS = {name: f"on {color}" for name, color in _FG_COLORS.items() if name != "default"}
+
+# Escape sequences sent to the shell for special keys
+_KEY_BYTES: dict[str, bytes] = {
+    "enter": b"\r",
+    "tab": b"\t",
+    "backspace": b"\x7f",
+    "delete": b"\x1b[3~",
+    "escape": b"\x1b",
+    "up": b"\x1b[A",
+    "down": b"\x1b[B",
+    "right": b"\x1b[C",
+    "left": b"\x1b[D",
+    "home": b"\x1b[H",
+    "end": b"\x1b[F",
+    "pageup": b"\x1b[5~",
+    "pagedown": b"\x1b[6~",
+    "ctrl+c": b"\x03",
+    "ctrl+d": b"\x04",
+    "ctrl+z": b"\x1a",
+    "ctrl+l": b"\x0c",
+    "ctrl+a": b"\x01",
+    "ctrl+e": b"\x05",
+    "ctrl+k": b"\x0b",
+    "ctrl+u": b"\x15",
+    "ctrl+r": b"\x12",
+}
+
 
 class Terminal(Static):
     """PTY-based terminal widget with shell support.
@@ -49,22 +86,45 @@ class Terminal(Static):
         Requires the `pyte` library for terminal emulation.
     """
 
+    # Reads drained per readiness callback before yielding to the event loop
+    MAX_READS_PER_WAKE = 16
+
+    READ_BUFFER_SIZE = 65536
+
+    # Seconds a hung-up shell gets to exit before it is killed
+    SHUTDOWN_GRACE = 0.05
+
     def __init__(self, working_dir: Path | None = None, **kwargs):
         super().__init__(**kwargs)
         self.working_dir = working_dir or Path.cwd()
         self.pty_fd: int | None = None
         self.pid: int | None = None
+        # (rows, cols) last applied to the PTY
+        self._pty_size: tuple[int, int] | None = None
         if pyte:
             self.pty_screen = pyte.Screen(120, 24)
-            self.pty_stream = pyte.Stream(self.pty_screen)
+            # Decodes incrementally, so characters split across reads survive
+            self.pty_stream = pyte.ByteStream(self.pty_screen)
         else:
             self.pty_screen = None
             self.pty_stream = None
-        self._read_task: asyncio.Task | None = None
+        # Rendered row and whether it has text, by row index
+        self._row_cache: dict[int, tuple[Text, bool]] = {}
+        # Rich style string per (fg, bg, bold, italics, underscore)
+        self._style_cache: dict[tuple, str] = {}
+        # Reused for every PTY read instead of allocating a bytes per read
+        self._read_view = memoryview(bytearray(self.READ_BUFFER_SIZE))
+        # Input not yet accepted by the PTY, written when it becomes writable
+        self._write_buf = bytearray()
+        # Pending coalesced repaint, if one is scheduled
+        self._repaint_handle: asyncio.Handle | None = None
 
     def on_mount(self) -> None:
         self.start_shell()
 
+    def on_show(self) -> None:
+        self.refresh_display()
+
     def start_shell(self) -> None:
         if not pyte:
             self.update("Error: pyte library not installed")
@@ -84,114 +144,206 @@ class Terminal(Static):
             flags = fcntl.fcntl(self.pty_fd, fcntl.F_GETFL)
             fcntl.fcntl(self.pty_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
             self.resize_pty(120, 24)
-            self._read_task = asyncio.create_task(self._read_pty())
+            asyncio.get_running_loop().add_reader(self.pty_fd, self._on_pty_readable)
 
     def resize_pty(self, cols: int, rows: int) -> None:
+        # Each TIOCSWINSZ sends the shell SIGWINCH, which can redraw the prompt
+        if (rows, cols) == self._pty_size:
+            return
         if self.pty_fd is not None and self.pty_screen:
             self.pty_screen.resize(rows, cols)
             winsize = struct.pack("HHHH", rows, cols, 0, 0)
             fcntl.ioctl(self.pty_fd, termios.TIOCSWINSZ, winsize)
-
-    async def _read_pty(self) -> None:
-        while self.pty_fd is not None:
+            self._pty_size = (rows, cols)
+
+    def _on_pty_readable(self) -> None:
+        """Drain pending shell output when the event loop reports the PTY readable."""
+        read_view = self._read_view
+        received = False
+        # Bounded so a shell producing endless output cannot starve the UI;
+        # the loop calls back again while data remains
+        for _ in range(self.MAX_READS_PER_WAKE):
             try:
-                data = os.read(self.pty_fd, 65536)
-                if data:
-                    self.pty_stream.feed(data.decode("utf-8", errors="replace"))
-                    self.refresh_display()
+                nbytes = os.readv(self.pty_fd, [read_view])
             except BlockingIOError:
-                pass
+                break
             except OSError:
+                # The shell has exited
+                nbytes = 0
+            if not nbytes:
+                asyncio.get_running_loop().remove_reader(self.pty_fd)
                 break
-            await asyncio.sleep(0.02)
+            self.pty_stream.feed(read_view[:nbytes])
+            received = True
+        if received and self._repaint_handle is None:
+            # Output arriving before the repaint runs only updates the screen
+            self._repaint_handle = asyncio.get_running_loop().call_soon(self._do_repaint)
+
+    def _do_repaint(self) -> None:
+        self._repaint_handle = None
+        self.refresh_display()
 
     def refresh_display(self) -> None:
         if not self.pty_screen:
             return
 
-        lines = []
-        for y in range(self.pty_screen.lines):
-            line = Text()
-            for x in range(self.pty_screen.columns):
-                char = self.pty_screen.buffer[y][x]
-                char_data = char.data if char.data else " "
-
-                style_parts = []
-
-                fg = char.fg
-                if fg == "default":
-                    fg_color = PYTE_COLORS["default"]
-                elif fg in PYTE_COLORS:
-                    fg_color = PYTE_COLORS[fg]
-                elif fg in PYTE_BRIGHT_COLORS:
-                    fg_color = PYTE_BRIGHT_COLORS[fg]
-                elif isinstance(fg, str) and fg.startswith("#"):
-                    fg_color = fg
-                else:
-                    fg_color = PYTE_COLORS["default"]
-                style_parts.append(fg_color)
-
-                bg = char.bg
-                if bg != "default":
-                    if bg in PYTE_COLORS:
-                        style_parts.append(f"on {PYTE_COLORS[bg]}")
-                    elif bg in PYTE_BRIGHT_COLORS:
-                        style_parts.append(f"on {PYTE_BRIGHT_COLORS[bg]}")
-
-                if char.bold:
-                    style_parts.append("bold")
-                if char.italics:
-                    style_parts.append("italic")
-                if char.underscore:
-                    style_parts.append("underline")
-
-                line.append(
-                    char_data, style=" ".join(style_parts) if style_parts else None
-                )
-
-            line_str = str(line).rstrip()
-            if line_str or y < self.pty_screen.lines - 1:
-                lines.append(line)
-
-        while lines and not str(lines[-1]).strip():
-            lines.pop()
-
-        result = Text()
-        for i, line in enumerate(lines):
-            result.append_text(line)
-            if i < len(lines) - 1:
-                result.append("\n")
-
-        self.update(result)
+        # While hidden or off-screen, changed rows stay in pyte's dirty set
+        # and are rendered by on_show
+        if not self.region:
+            return
+
+        screen = self.pty_screen
+        # pyte records the rows changed since the last render; nothing to
+        # do if no row changed
+        dirty = screen.dirty
+        if not dirty:
+            return
+
+        row_cache = self._row_cache
+        for y in dirty:
+            if y < screen.lines:
+                row_cache[y] = self._render_row(screen.buffer[y])
+        dirty.clear()
+        if len(row_cache) > screen.lines:
+            # The screen shrank
+            for y in range(screen.lines, max(row_cache) + 1):
+                row_cache.pop(y, None)
+
+        # Rows after the last one with text are not shown
+        last_row = max((y for y, (_, has_text) in row_cache.items() if has_text), default=-1)
+        self.update(_NEWLINE.join(row_cache[y][0] for y in range(last_row + 1)))
+
+    def _render_row(self, row) -> tuple[Text, bool]:
+        """Render one pyte buffer row, and report whether it has any text."""
+        columns = self.pty_screen.columns
+        style_cache = self._style_cache
+
+        # pyte stores cells sparsely, so only written cells are scanned.
+        # Trailing blank cells with no background or underline are invisible.
+        has_text = False
+        end = 0
+        for x, char in row.items():
+            if x >= columns:
+                continue
+            if char.data.strip():
+                has_text = True
+            elif char.bg == "default" and not char.underscore:
+                continue
+            if x >= end:
+                end = x + 1
+
+        line = Text()
+        # Adjacent cells with the same style are appended as one run
+        run: list[str] = []
+        run_style = None
+        for char in map(row.__getitem__, range(end)):
+            char_data = char.data if char.data else " "
+
+            # Most cells share a handful of attribute combinations. Char
+            # is a namedtuple, so slicing out (fg, bg, bold, italics,
+            # underscore) builds the key without five attribute lookups.
+            key = char[1:6]
+            style = style_cache.get(key, _MISSING)
+            if style is _MISSING:
+                style = style_cache[key] = self._compute_style(*key)
+
+            if style != run_style and run:
+                line.append("".join(run), style=run_style)
+                run = []
+            run_style = style
+            run.append(char_data)
+        if run:
+            line.append("".join(run), style=run_style)
+        return line, has_text
+
+    @staticmethod
+    def _compute_style(fg, bg, bold: bool, italics: bool, underscore: bool) -> str:
+        """Build the Rich style string for a pyte cell's attributes."""
+        fg_color = _FG_COLORS.get(fg)
+        if fg_color is None:
+            fg_color = fg if isinstance(fg, str) and fg.startswith("#") else _FG_COLORS["default"]
+        style_parts = [fg_color]
+
+        bg_color = _BG_COLORS.get(bg)
+        if bg_color is not None:
+            style_parts.append(bg_color)
+
+        if bold:
+            style_parts.append("bold")
+        if italics:
+            style_parts.append("italic")
+        if underscore:
+            style_parts.append("underline")
+
+        return " ".join(style_parts)
+
+    def send_bytes(self, data: bytes) -> None:
+        if self.pty_fd is None:
+            return
+        if self._write_buf:
+            # Earlier input is still waiting; keep the order
+            self._write_buf += data
+            return
+        self._write_buf += data
+        self._flush_writes()
+        if self._write_buf:
+            asyncio.get_running_loop().add_writer(self.pty_fd, self._on_pty_writable)
+
+    def _flush_writes(self) -> None:
+        try:
+            written = os.write(self.pty_fd, self._write_buf)
+        except BlockingIOError:
+            return
+        except OSError:
+            # The shell has exited; the input has nowhere to go
+            written = len(self._write_buf)
+        del self._write_buf[:written]
+
+    def _on_pty_writable(self) -> None:
+        self._flush_writes()
+        if not self._write_buf:
+            asyncio.get_running_loop().remove_writer(self.pty_fd)
 
     def send_key(self, key: str) -> None:
-        if self.pty_fd is not None:
-            try:
-                os.write(self.pty_fd, key.encode("utf-8"))
-            except OSError:
-                pass
+        self.send_bytes(key.encode("utf-8"))
 
     def send_text(self, text: str) -> None:
-        if self.pty_fd is not None:
-            try:
-                os.write(self.pty_fd, text.encode("utf-8"))
-            except OSError:
-                pass
+        self.send_bytes(text.encode("utf-8"))
 
     def on_unmount(self) -> None:
-        if self._read_task:
-            self._read_task.cancel()
+        if self._repaint_handle is not None:
+            self._repaint_handle.cancel()
+            self._repaint_handle = None
         if self.pty_fd is not None:
+            loop = asyncio.get_running_loop()
+            loop.remove_reader(self.pty_fd)
+            loop.remove_writer(self.pty_fd)
             try:
                 os.close(self.pty_fd)
             except OSError:
                 pass
         if self.pid is not None:
-            try:
-                os.kill(self.pid, 9)
-                os.waitpid(self.pid, os.WNOHANG)
-            except (OSError, ChildProcessError):
-                pass
+            # Closing the PTY hangs up the shell; reap it off the event loop
+            asyncio.get_running_loop().run_in_executor(
+                None, self._reap_shell, self.pid, self.SHUTDOWN_GRACE
+            )
+            self.pid = None
+
+    @staticmethod
+    def _reap_shell(pid: int, grace: float) -> None:
+        """Wait for the shell to exit after SIGHUP, killing it after ``grace`` seconds."""
+        try:
+            os.kill(pid, signal.SIGHUP)
+            deadline = time.monotonic() + grace
+            while time.monotonic() < deadline:
+                if os.waitpid(pid, os.WNOHANG)[0]:
+                    return
+                time.sleep(0.005)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        except OSError:
+            # Already reaped
+            pass
 
 
 class TerminalInput(Static):
@@ -206,37 +358,11 @@ class TerminalInput(Static):
     def on_key(self, event: events.Key) -> None:
         event.stop()
 
-        key = event.key
-
-        key_map = {
-            "enter": "\r",
-            "tab": "\t",
-            "backspace": "\x7f",
-            "delete": "\x1b[3~",
-            "escape": "\x1b",
-            "up": "\x1b[A",
-            "down": "\x1b[B",
-            "right": "\x1b[C",
-            "left": "\x1b[D",
-            "home": "\x1b[H",
-            "end": "\x1b[F",
-            "pageup": "\x1b[5~",
-            "pagedown": "\x1b[6~",
-            "ctrl+c": "\x03",
-            "ctrl+d": "\x04",
-            "ctrl+z": "\x1a",
-            "ctrl+l": "\x0c",
-            "ctrl+a": "\x01",
-            "ctrl+e": "\x05",
-            "ctrl+k": "\x0b",
-            "ctrl+u": "\x15",
-            "ctrl+r": "\x12",
-        }
-
-        if key in key_map:
-            self.terminal.send_key(key_map[key])
+        data = _KEY_BYTES.get(event.key)
+        if data is not None:
+            self.terminal.send_bytes(data)
         elif event.character and len(event.character) == 1:
-            self.terminal.send_text(event.character)
+            self.terminal.send_bytes(event.character.encode("utf-8"))
 
     def render(self) -> Text:
         return Text("▌", style="blink")
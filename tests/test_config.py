@@ -107,3 +107,65 @@ class TestConfig:
         """Config should define standard config paths."""
         assert Config.CONFIG_FILE.name == "config.toml"
         assert Config.PROJECT_CONFIG_FILE == ".cli-ide.toml"
+
+    def test_load_from_project_file(self, monkeypatch):
+        """Project config values should override defaults."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.setattr(Config, "CONFIG_FILE", Path(tmpdir) / "config.toml")
+            (Path(tmpdir) / Config.PROJECT_CONFIG_FILE).write_text(
+                '[editor]\ntab_size = 2\n\n[sidebar]\nvisible = false\n'
+            )
+            config = Config.load(Path(tmpdir))
+
+            assert config.editor.tab_size == 2
+            assert config.editor.theme == "light-ide"
+            assert config.sidebar.visible is False
+            assert config.terminal.height == 14
+
+    def test_save_round_trip(self, monkeypatch):
+        """Saved config should load back and skip rewriting unchanged content."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir)
+            monkeypatch.setattr(Config, "CONFIG_DIR", config_dir)
+            monkeypatch.setattr(Config, "CONFIG_FILE", config_dir / "config.toml")
+
+            config = Config()
+            config.editor.tab_size = 8
+            config.save()
+            mtime = Config.CONFIG_FILE.stat().st_mtime_ns
+
+            config.save()
+
+            assert Config.CONFIG_FILE.stat().st_mtime_ns == mtime
+            assert not (config_dir / "config.toml.tmp").exists()
+            assert Config.load().editor.tab_size == 8
+
+    def test_save_overwrites_invalid_utf8(self, monkeypatch):
+        """save should replace an existing config that is not valid UTF-8."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir)
+            monkeypatch.setattr(Config, "CONFIG_DIR", config_dir)
+            monkeypatch.setattr(Config, "CONFIG_FILE", config_dir / "config.toml")
+            Config.CONFIG_FILE.write_bytes(b"\xff\xfe not utf-8")
+
+            Config().save()
+
+            assert Config.CONFIG_FILE.read_bytes().startswith(b"# CLI-IDE Configuration")
+            assert not (config_dir / "config.toml.tmp").exists()
+
+    def test_save_failure_removes_temp_file(self, monkeypatch):
+        """A failed save should not leave the temporary file behind."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir)
+            monkeypatch.setattr(Config, "CONFIG_DIR", config_dir)
+            monkeypatch.setattr(Config, "CONFIG_FILE", config_dir / "config.toml")
+
+            def fail_replace(src, dst):
+                raise OSError("replace failed")
+
+            monkeypatch.setattr("cli_ide.config.settings.os.replace", fail_replace)
+
+            with pytest.raises(OSError):
+                Config().save()
+
+            assert not (config_dir / "config.toml.tmp").exists()
@@ -122,6 +122,19 @@ class TestEditorPane:
 
         assert pane.get_prev_file() == "/a.py"
 
+    def test_tab_navigation_after_middle_removal(self):
+        """Tab navigation should stay consistent after removing a middle tab."""
+        pane = EditorPane()
+        pane.add_file(OpenFile(Path("/a.py"), "a", "a"))
+        pane.add_file(OpenFile(Path("/b.py"), "b", "b"))
+        pane.add_file(OpenFile(Path("/c.py"), "c", "c"))
+
+        pane.remove_file(Path("/b.py"))
+        pane.active_file = "/c.py"
+
+        assert pane.get_prev_file() == "/a.py"
+        assert pane.get_next_file() == "/a.py"
+
     def test_get_next_file_handles_invalid_active(self):
         """get_next_file should handle invalid active_file gracefully."""
         pane = EditorPane()
@@ -176,6 +189,19 @@ class TestEditorState:
         assert state.get_pane_by_id("main") is not None
         assert state.get_pane_by_id("nonexistent") is None
 
+    def test_add_and_remove_pane(self):
+        """add_pane and remove_pane should keep ID lookup in sync."""
+        state = EditorState()
+        pane = EditorPane(id="second")
+        state.add_pane(pane)
+
+        assert state.get_pane_by_id("second") is pane
+
+        state.remove_pane(pane)
+
+        assert state.get_pane_by_id("second") is None
+        assert len(state.panes) == 1
+
 
 class TestMultiSelectState:
     """Tests for MultiSelectState dataclass."""
@@ -211,3 +237,15 @@ class TestMultiSelectState:
         assert ms.active is False
         assert ms.target_text == ""
         assert ms.count == 0
+
+    def test_contains(self):
+        """contains should reflect added positions and be cleared by reset."""
+        ms = MultiSelectState()
+        ms.add_position(2, 3)
+
+        assert ms.contains(2, 3) is True
+        assert ms.contains(3, 2) is False
+
+        ms.reset()
+
+        assert ms.contains(2, 3) is False
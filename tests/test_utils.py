@@ -4,7 +4,16 @@ from pathlib import Path
 
 import pytest
 
-from cli_ide.utils import get_language, path_to_tab_id
+from cli_ide.utils import get_language, new_pane_id, path_to_tab_id
+
+
+class TestNewPaneId:
+    """Tests for new_pane_id function."""
+
+    def test_ids_are_unique(self):
+        """Successive calls should never repeat an ID."""
+        ids = [new_pane_id() for _ in range(100)]
+        assert len(set(ids)) == len(ids)
 
 
 class TestPathToTabId:
@@ -61,3 +70,12 @@ class TestGetLanguage:
         """Extension matching should be case insensitive."""
         assert get_language(Path("/test.PY")) == "python"
         assert get_language(Path("/test.Py")) == "python"
+
+    def test_compound_extension(self):
+        """Compound extensions should match as a whole."""
+        assert get_language(Path("/styles.module.css")) == "css"
+        assert get_language(Path("/styles.MODULE.CSS")) == "css"
+
+    def test_dotfile_has_no_language(self):
+        """A bare dotfile name should not be treated as an extension."""
+        assert get_language(Path("/.py")) is None